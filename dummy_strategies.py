@@ -28,6 +28,10 @@ Participants who read this file understand:
 """
 
 
+import bisect
+import numpy as np
+
+
 # ======================================================================
 # =========================  DUMMY STRATEGIES  ==========================
 # ======================================================================
@@ -100,7 +104,7 @@ class DummyStrategy2:
         • Demonstrates how to read >>> opponent bets <<< using r1_bets/r2_bets.
 
     WHAT IT TEACHES:
-        • You can loop through rX_bets (DICT of {player_index : amount}).
+        • You can loop through rX_bets (read-only ARRAY of amounts, indexed by player index).
         • Compare others’ bets with your own (self.my_index).
         • Adjust aggression based on how many opponents are betting high.
     """
@@ -119,7 +123,9 @@ class DummyStrategy2:
         my_bet = r1_bets[self.my_index]
         
         # Count opponents whose R1 bet was higher than ours
-        higher = sum(b > my_bet for b in r1_bets.values())
+        # (bisect on the sorted bets finds how many lie strictly above my_bet).
+        sorted_bets = sorted(r1_bets[i] for i in range(len(r1_bets)))
+        higher = len(sorted_bets) - bisect.bisect_right(sorted_bets, my_bet)
 
         # If we are strong and no one is fighting us, bet max (1.5x)
         if win_prob > 0.6 and higher == 0:
@@ -134,7 +140,8 @@ class DummyStrategy2:
         my_bet = r2_bets[self.my_index]
         
         # Count opponents whose R2 bet was higher than ours
-        higher = sum(b > my_bet for b in r2_bets.values())
+        sorted_bets = sorted(r2_bets[i] for i in range(len(r2_bets)))
+        higher = len(sorted_bets) - bisect.bisect_right(sorted_bets, my_bet)
 
         # If we are very strong and no one is fighting us, bet max (1.25x)
         if win_prob > 0.7 and higher == 0:
@@ -287,48 +294,60 @@ class DummyStrategy5:
         • Demonstrates using TOURNAMENT HISTORY to create a simple opponent looseness model.
 
     WHAT IT TEACHES:
-        • History Model: How to initialize and update a tracking dictionary 
-          (self.looseness_model) using data from 'match_history'.
+        • History Model: How to initialize and update per-opponent counters
+          (self.games_played / self.games_seen) using data from 'match_history'.
         • Concept: Tracks how often opponents play Round 1 to classify them as 
           "Loose" or "Tight" players and adjust betting for value.
     """
 
     def __init__(self):
         self.my_index = -1
-        # looseness_model: { player_index : { "games_played": int, "games_seen": int } }
-        self.looseness_model = {}
+        # Looseness model as parallel NumPy arrays indexed by player_index:
+        #   games_played[i] = games player i did NOT fold in, games_seen[i] = games observed.
+        self.games_played = np.zeros(5, dtype=np.int32)
+        self.games_seen = np.zeros(5, dtype=np.int32)
+        # True for every opponent (everyone except us); set once my_index is known.
+        self.mask = np.ones(5, dtype=bool)
+        # Cached get_avg_opp_looseness() result; None until computed for this game.
+        self._avg_cache = None
 
     def initialize_game(self, match_history, current_game_num):
-        # 1. Initialize profiles on first run
+        # The model only changes here, so the cached average is invalidated once per game.
+        self._avg_cache = None
+
+        # 1. Initialize profiles on first run (the engine has assigned my_index by now)
         if current_game_num == 1:
-            for i in range(5):
-                if i != self.my_index:
-                    self.looseness_model[i] = {"games_played": 0, "games_seen": 0}
+            self.games_played[:] = 0
+            self.games_seen[:] = 0
+            self.mask[:] = True
+            self.mask[self.my_index] = False
             return
 
         # 2. Update profiles based on the LAST completed game
         last_game = match_history[-1]
+        mi = self.my_index
         for pid_int, pdata in last_game.items():
-            if isinstance(pid_int, int) and pid_int != self.my_index:
-                
-                profile = self.looseness_model.setdefault(pid_int, {"games_played": 0, "games_seen": 0})
-                profile["games_seen"] += 1
+            if isinstance(pid_int, int) and pid_int != mi:
+                self.games_seen[pid_int] += 1
                 # Increment games_played if they did NOT fold in Round 1
                 if not pdata.get("folded", False):
-                    profile["games_played"] += 1
+                    self.games_played[pid_int] += 1
 
     def get_avg_opp_looseness(self):
         """Calculates the average looseness score (R1 participation rate) across all opponents."""
-        total_looseness = 0.0
-        total_players = 0
-        
-        for profile in self.looseness_model.values():
-            if profile["games_seen"] > 0:
-                total_looseness += profile["games_played"] / profile["games_seen"]
-                total_players += 1
-                
+        if self._avg_cache is not None:
+            return self._avg_cache
+
+        seen = self.games_seen[self.mask]
+        played = self.games_played[self.mask]
+        valid = seen > 0
+
         # Default looseness is 20% if no data is available
-        return total_looseness / total_players if total_players > 0 else 0.20
+        if not valid.any():
+            self._avg_cache = 0.20
+        else:
+            self._avg_cache = float((played[valid] / seen[valid]).mean())
+        return self._avg_cache
 
     def round1(self, hole, comm, stacks, pot, win_prob):
         avg_looseness = self.get_avg_opp_looseness()
@@ -3,16 +3,32 @@ engine_core.py
 
 Core engine components extracted from main.py:
  - configuration constants (NUM_GAMES, STARTING_STACK, BUY_IN, etc.)
- - PlayerState class (Manages per-player, per-game data)
+ - MatchState / PlayerState classes (Manage per-player, per-game data)
  - TREYS / equity helper functions (Poker card math and win probability calculation)
+ - Precomputed preflop equity tables (169 canonical hand classes, one table per field size)
  - Uses the 'treys' library (Evaluator, Card, lookup) for hand scoring.
  - Preserves original function signatures and behavior from the source file.
 """
 
-import random
-import itertools
-# Note: Ensure the 'treys' library is installed: pip install treys
+import functools
+import os
+import pickle
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Final
+import numpy as np
+# Note: Ensure the 'treys' and 'numpy' libraries are installed: pip install treys numpy
 from treys import Evaluator, Card, lookup
+from engine_tables import rank7_batch, WORST_SCORE
+
+# Optional compiled Monte Carlo kernel and hand ranking (engine_fast.py, requires numba).
+# If it cannot be imported, the NumPy simulation and treys scoring below are used instead.
+try:
+    from engine_fast import mc_equity as fast_mc_equity, rank7 as fast_rank7
+except ImportError:
+    fast_mc_equity = None
+    fast_rank7 = None
 
 
 # ============================================================
@@ -21,9 +37,9 @@ from treys import Evaluator, Card, lookup
 #
 # These constants define the fundamental rules and structure of the tournament.
 
-NUM_GAMES = 50          # Total number of games (hands) to be played in the match.
-STARTING_STACK = 10000  # The initial stack (money) each player starts with.
-BUY_IN = 100            # The mandatory amount paid by all active players to enter each game (hand).
+NUM_GAMES: Final = 50          # Total number of games (hands) to be played in the match.
+STARTING_STACK: Final = 10000  # The initial stack (money) each player starts with.
+BUY_IN: Final = 100            # The mandatory amount paid by all active players to enter each game (hand).
 
 # Friendly labels for printing and logging. These correspond to the strategies loaded.
 PLAYER_NAMES = ["Player A", "Player B", "Player C", "Player D", "Player E"]
@@ -33,45 +49,117 @@ PLAYER_NAMES = ["Player A", "Player B", "Player C", "Player D", "Player E"]
 #   - RANKS: '2'..'9', 'T' (Ten), 'J' (Jack), 'Q' (Queen), 'K' (King), 'A' (Ace)
 SUITS = ['h', 'd', 's', 'c']
 RANKS = ['2','3','4','5','6','7', '8', '9', 'T', 'J', 'Q', 'K', 'A']
+RANK_VALUE = {r: i for i, r in enumerate(RANKS)}
+
+# Pre-parsed treys integer encodings for every card string, built once at import.
+# The equity simulation works purely on these ints and only converts at its boundaries.
+CARD_INT = {r + s: Card.new(r + s) for s in SUITS for r in RANKS}
+INT_DECK = list(CARD_INT.values())
+
+# Bitboard form of the deck: card i of INT_DECK owns bit i of a 52-bit mask, so sets of
+# cards combine and subtract with single integer operations.
+CARD_BIT = {c: 1 << i for i, c in enumerate(CARD_INT)}
+FULL_DECK_MASK = (1 << len(INT_DECK)) - 1
 
 
 # ============================================================
-# 2. PLAYER STATE CLASS
+# 2. PLAYER STATE CLASSES
 # ============================================================
 #
-# PlayerState is a container that holds all mutable, real-time data for one player
-# in the context of the tournament and the current game.
+# MatchState holds the numeric state of every player as parallel NumPy arrays
+# (struct-of-arrays), so main.py can update all players' stacks and bets at once.
+# PlayerState is a per-player container for the rest, and a view onto its MatchState entries.
+
+@dataclass
+class MatchState:
+    """
+    Numeric per-player state for a whole match, indexed by player index.
+    """
+    stacks: np.ndarray           # Current total money available (float64).
+    is_lost_match: np.ndarray    # True if stack < BUY_IN, meaning player is eliminated.
+    current_bet_r1: np.ndarray   # Amount bet in Round 1 (Flop).
+    current_bet_r2: np.ndarray   # Amount bet in Round 2 (Turn).
+    final_round_bet: np.ndarray  # Amount bet in Round 3 (River). Used for the winning cap.
+    has_folded: np.ndarray       # Whether the player chose to fold in any betting round.
+    hand_score: np.ndarray       # Final numerical score (treys format: lower is better).
+
+    @classmethod
+    def new(cls, num_players):
+        """
+        Creates the state of num_players players, each starting with STARTING_STACK.
+        """
+        return cls(
+            stacks=np.full(num_players, float(STARTING_STACK)),
+            is_lost_match=np.zeros(num_players, dtype=bool),
+            current_bet_r1=np.zeros(num_players),
+            current_bet_r2=np.zeros(num_players),
+            final_round_bet=np.zeros(num_players),
+            has_folded=np.zeros(num_players, dtype=bool),
+            hand_score=np.zeros(num_players, dtype=np.int32),
+        )
+
+    def reset_round(self):
+        """
+        Resets every player's per-game (hand) state at once, but preserves the stacks.
+        """
+        self.current_bet_r1[:] = 0
+        self.current_bet_r2[:] = 0
+        self.final_round_bet[:] = 0
+        self.hand_score[:] = 0
+        self.has_folded[:] = False
+
+
+def _state_field(name):
+    """
+    A PlayerState property reading and writing this player's entry of MatchState.<name>.
+    """
+    def get(self):
+        return getattr(self.state, name)[self._slot].item()
+
+    def set(self, value):
+        getattr(self.state, name)[self._slot] = value
+
+    return property(get, set)
+
 
 class PlayerState:
-    def __init__(self, name, strategy, index):
+    def __init__(self, name, strategy, index, state=None):
         self.name = name                 # Player's display name (e.g., "Player A").
         self.strategy = strategy         # Reference to the actual strategy object (e.g., strategyA).
         self.index = index               # Unique index (0 to N-1) for this player, used for lookup.
 
-        # Tournament-Level State (Persists across games):
-        self.stack = STARTING_STACK      # Current total money available.
-        self.is_lost_match = False       # True if stack < BUY_IN, meaning player is eliminated.
+        # Numeric state lives at entry `index` of a MatchState shared by all players;
+        # a standalone player gets a single-entry one of its own.
+        self._owns_state = state is None
+        if self._owns_state:
+            self.state, self._slot = MatchState.new(1), 0
+        else:
+            self.state, self._slot = state, index
 
         # Game-Level State (Resets every hand):
         self.hole_cards = []             # The 2 private cards dealt to the player.
-        self.current_bet_r1 = 0          # Amount bet in Round 1 (Flop).
-        self.current_bet_r2 = 0          # Amount bet in Round 2 (Turn).
-        self.final_round_bet = 0         # Amount bet in Round 3 (River). Used for the winning cap.
-        self.has_folded = False          # Whether this player chose to fold in any betting round.
-        self.hand_score = 0              # Final numerical score (treys format: lower is better).
         self.round_equities = []         # Stores [R1 equity, R2 equity, R3 equity] for history.
 
+    # Tournament-Level State (Persists across games):
+    stack = _state_field("stacks")
+    is_lost_match = _state_field("is_lost_match")
+
+    # Game-Level State (Resets every hand):
+    current_bet_r1 = _state_field("current_bet_r1")
+    current_bet_r2 = _state_field("current_bet_r2")
+    final_round_bet = _state_field("final_round_bet")
+    has_folded = _state_field("has_folded")
+    hand_score = _state_field("hand_score")
+
     def reset_round(self):
         """
         Resets all per-game (hand) state before dealing new cards, but preserves the stack.
-        Called by main.py at the start of every new game.
+        Called by main.py at the start of every new game, after MatchState.reset_round()
+        has reset the shared numeric state; a standalone player resets its own here.
         """
+        if self._owns_state:
+            self.state.reset_round()
         self.hole_cards = []
-        self.current_bet_r1 = 0
-        self.current_bet_r2 = 0
-        self.final_round_bet = 0
-        self.hand_score = 0
-        self.has_folded = False
         self.round_equities = []
 
 
@@ -79,8 +167,22 @@ class PlayerState:
 # 3. TREYS / EQUITY HELPER FUNCTIONS
 # ============================================================
 
-# treys hand evaluator instance. This is used globally for all hand scoring.
+# treys hand evaluator instance. This is used for all hand scoring on the importing thread;
+# any other thread (e.g. a background equity worker) lazily gets its own instance.
 evaluator = Evaluator() 
+_thread_state = threading.local()
+_thread_state.evaluator = evaluator
+
+
+def _get_evaluator():
+    """
+    Returns the calling thread's treys Evaluator, creating one on first use.
+    """
+    try:
+        return _thread_state.evaluator
+    except AttributeError:
+        _thread_state.evaluator = Evaluator()
+        return _thread_state.evaluator
 
 
 def create_deck():
@@ -97,33 +199,20 @@ def evaluate_best_hand(seven_cards):
     (2 hole cards + 5 community cards) using the 'treys' evaluator.
     
     Args:
-        seven_cards (list[str]): A list of 7 card strings (e.g., ['Ad', 'As', 'Kd', 'Ks', 'Qd', 'Qs', 'Jd']).
+        seven_cards (list[int]): A list of 7 treys card ints (see CARD_INT), hole cards first.
 
     Returns:
         int: The numerical treys score (1=Royal Flush, 7462=7-high).
     """
-    # The worst possible score in treys is 7462, use 7463 as the sentinel.
-    best_score = 7463 
-    
-    # Check all possible 5-card combinations from the 7 available cards.
-    for combo in itertools.combinations(seven_cards, 5):
-        try:
-            # Convert string representation (e.g., 'Ah') to treys Card objects.
-            combo_objs = [Card.new(c) for c in combo]
-            
-            # Evaluate the 5-card combination.
-            # treys.evaluate expects two lists: hand and board. We put all 5 cards
-            # in the 'hand' argument and use an empty board '[]'.
-            score = evaluator.evaluate(combo_objs, []) 
-            
-            # Find the minimum (best) score.
-            if score < best_score:
-                best_score = score
-        except Exception:
-            # Ignore any errors during card parsing (should not happen with valid input).
-            continue
-            
-    return best_score
+    # The compiled treys-compatible ranker (engine_fast.rank7) gives identical scores
+    # several times faster than treys itself, so it is preferred when available.
+    if fast_rank7 is not None:
+        return int(fast_rank7(np.array(seven_cards, dtype=np.int64)))
+
+    # treys.evaluate already picks the best 5-card hand out of all 7 cards, so a
+    # single call replaces the manual 7-choose-5 loop. The first 2 cards are
+    # passed as the 'hand' and the remaining 5 as the 'board'.
+    return _get_evaluator().evaluate(seven_cards[:2], seven_cards[2:])
 
 
 def get_clean_deck():
@@ -139,79 +228,225 @@ def get_clean_deck():
 def calculate_multiplayer_equity(hero_hand, current_board, num_players=5, iterations=500):
     """
     Estimates the win probability (equity) for the Hero's hand against a field
-    of randomly dealt opponents using Monte Carlo simulation.
-    
-    This function is computationally expensive and runs on a background thread in the real
-    competition environment (not shown here) but runs synchronously in this file.
+    of randomly dealt opponents.
+
+    Results are memoized: the cards are suit-relabeled to a canonical form, so repeated
+    and suit-isomorphic queries return the first cached estimate instead of simulating
+    again (see _cached_equity; cache_clear() resets it). Preflop queries are answered
+    from the precomputed table for the field size, and later streets run a Monte Carlo
+    simulation the first time a spot is seen.
+
+    This function can be expensive on a cache miss and runs on a background thread in the
+    real competition environment (not shown here) but runs synchronously in this file.
 
     Args:
         hero_hand (list[str]): Hero's two hole cards (e.g., ['Ad', 'Ks']).
         current_board (list[str]): The community cards revealed so far (0, 3, 4, or 5 cards).
         num_players (int): The total number of players currently in the hand.
-        iterations (int): The number of times to run the simulation.
+        iterations (int): The number of times to run the simulation (ignored preflop).
 
     Returns:
-        tuple (float, float): (Win Percentage, Tie Percentage - unused/returns 0.0)
+        float: Win probability (0..1), ties counted as half a win.
     """
-    wins = 0
-    full_deck = get_clean_deck()
-    
-    # Identify all cards we know (Hero's hand + community board).
-    known_cards = set(hero_hand + current_board)
+    # With no opponents left, Hero cannot lose: skip the simulation entirely.
+    if num_players <= 1:
+        return 1.0
+
+    # Neither card order nor which suit is which affects equity, so the cards are
+    # suit-relabeled and put into frozensets to form canonical cache keys.
+    hero_hand, current_board = _canonical_suits(hero_hand, current_board)
+    return _cached_equity(frozenset(hero_hand), frozenset(current_board), num_players, iterations)
+
+
+def _canonical_suits(hero_hand, current_board):
+    """
+    Renames suits in order of first appearance, walking Hero's hand and then the board
+    (each sorted by rank), e.g. (['Kd', 'As'], ['Qh', '7s', '2c']) -> (['Ah', 'Kd'], ['Qs', '7h', '2c']).
+    Suit equality is preserved, so isomorphic spots such as (As, Kd) and (Ac, Kh) on
+    similarly relabeled boards share one cache entry and one simulation.
+    """
+    suit_map = {}
+    canonical = []
+    for cards in (hero_hand, current_board):
+        relabeled = []
+        for c in sorted(cards, key=lambda c: RANK_VALUE[c[0]], reverse=True):
+            if c[1] not in suit_map:
+                suit_map[c[1]] = SUITS[len(suit_map)]
+            relabeled.append(c[0] + suit_map[c[1]])
+        canonical.append(relabeled)
+    return canonical
+
+
+@functools.lru_cache(maxsize=100_000)
+def _cached_equity(hero_cards, board_cards, num_players, iterations):
+    """
+    Memoized body of calculate_multiplayer_equity, keyed on frozensets of the cards.
+    Repeated (hand, board, num_players, iterations) queries reuse the first estimate.
+    """
+    hero_hand = list(hero_cards)
+    current_board = list(board_cards)
+
+    # Preflop equity only depends on the canonical hand class and the field size,
+    # so it is answered from that field size's precomputed table instead of simulating.
+    if len(current_board) == 0:
+        return _get_preflop_table(num_players)[_canonical_class(hero_hand)]
+
+    return _monte_carlo_equity(hero_hand, current_board, num_players, iterations)
+
+
+# Lets callers reset the memoized equities, e.g. between matches.
+calculate_multiplayer_equity.cache_clear = _cached_equity.cache_clear
+
+
+# Worker threads for calculate_multiplayer_equities. Created on first use.
+_equity_pool = None
+
+
+def calculate_multiplayer_equities(hands, current_board, num_players=5, iterations=500):
+    """
+    Batch form of calculate_multiplayer_equity: the equity of every hand in `hands`
+    on the same board and field size, computed concurrently where it helps.
+
+    Args:
+        hands (list[list[str]]): The hole cards of each player to evaluate.
+        current_board (list[str]): The community cards revealed so far.
+        num_players (int): The total number of players currently in the hand.
+        iterations (int): The number of times to run each simulation.
+
+    Returns:
+        list[float]: Win probability (0..1) of each hand, in the order of `hands`.
+    """
+    global _equity_pool
+    if num_players <= 1:
+        return [1.0] * len(hands)
+
+    equity = functools.partial(calculate_multiplayer_equity, current_board=current_board,
+                               num_players=num_players, iterations=iterations)
+
+    # The compiled kernel already spreads each simulation over every core, and its
+    # launches are serialized by engine_fast's kernel lock anyway, so only the NumPy
+    # fallback is fanned out to the pool.
+    if fast_mc_equity is not None or len(hands) < 2:
+        return [equity(hand) for hand in hands]
+
+    # Threads rather than processes: NumPy releases the GIL in the heavy array work,
+    # and workers share the equity cache and lookup tables instead of rebuilding them.
+    if _equity_pool is None:
+        _equity_pool = ThreadPoolExecutor(max_workers=os.cpu_count())
+    return list(_equity_pool.map(equity, hands))
+
+
+def _monte_carlo_equity(hero_hand, current_board, num_players, iterations):
+    """
+    The Monte Carlo simulation behind calculate_multiplayer_equity (same arguments).
+    """
+    # Convert the known cards (Hero's hand + community board) to treys ints once.
+    hero_ints = [CARD_INT[c] for c in hero_hand]
+    board_ints = [CARD_INT[c] for c in current_board]
+    known_mask = 0
+    for c in hero_hand + current_board:
+        known_mask |= CARD_BIT[c]
     
     # The deck of unknown cards from which opponents and remaining board cards will be drawn.
-    remaining_deck = [c for c in full_deck if c not in known_cards]
+    remaining_mask = FULL_DECK_MASK ^ known_mask
+    remaining_deck = [card for i, card in enumerate(INT_DECK) if remaining_mask >> i & 1]
     num_opponents = num_players - 1
 
-    for _ in range(iterations):
-        random.shuffle(remaining_deck)
-        
-        # Calculate how many community cards are still needed (max 5).
-        cards_needed_on_board = 5 - len(current_board)
-        
-        # Safety check: Ensure enough cards exist in the deck for the simulation run.
-        if cards_needed_on_board + num_opponents * 2 > len(remaining_deck):
-            continue
-
-        # 1. Complete the board (the 'runout' of remaining community cards).
-        runout = remaining_deck[:cards_needed_on_board]
-        final_board = current_board + runout
-        
-        # 2. Deal 2 cards per opponent from the remaining deck.
-        deck_idx = cards_needed_on_board
-        opponent_hands = []
-        for _ in range(num_opponents):
-            opp_hole = remaining_deck[deck_idx : deck_idx + 2]
-            opponent_hands.append(opp_hole)
-            deck_idx += 2
-
-        # 3. Evaluate Hero's final 7-card hand score.
-        hero_score = evaluate_best_hand(hero_hand + final_board)
-        
-        # 4. Evaluate all Opponents' final 7-card hand scores.
-        opp_scores = [evaluate_best_hand(opp_hole + final_board) for opp_hole in opponent_hands]
-        
-        # Find the best score among all opponents (lowest numerical score).
-        if not opp_scores:
-            # If no opponents (num_players=1), Hero always wins.
-            best_opponent_score = 7463 
-        else:
-            best_opponent_score = min(opp_scores)
+    # Calculate how many community cards are still needed (max 5), and how many
+    # cards a single simulated deal draws (the runout plus 2 per opponent).
+    cards_needed_on_board = 5 - len(current_board)
+    cards_per_deal = cards_needed_on_board + num_opponents * 2
 
-        # 5. Check outcome for this iteration.
-        if hero_score < best_opponent_score:
-            wins += 1    # Hero wins (score is lower/better than best opponent)
-        elif hero_score == best_opponent_score:
-            wins += 0.5  # Hero ties with the best opponent
+    # Safety check: Ensure enough cards exist in the deck for the simulation run.
+    # The check is loop-invariant, so if it fails no iteration can ever be dealt.
+    if cards_per_deal > len(remaining_deck):
+        return 0.0
 
-    # Calculate final win percentage based on total iterations.
-    if iterations == 0:
-        win_pct = 0.0
+    if fast_mc_equity is not None:
+        return fast_mc_equity(hero_ints, board_ints, remaining_deck, num_opponents, iterations)
+
+    if cards_needed_on_board == 1:
+        # Turn: enumerate every possible river exactly and only sample opponents.
+        deals = _deal_turn_batch(remaining_deck, iterations, num_opponents)
+    else:
+        deals = _deal_batch(remaining_deck, iterations, cards_per_deal)
+
+    num_deals = len(deals)
+    if num_deals == 0:
+        return 0.0
+
+    # Every deal is scored at once with NumPy (engine_tables.rank7_batch) instead of
+    # looping over deals in Python. Each row of a 7-card matrix is one hand:
+    # hole cards first, then the known board, then that deal's runout.
+    runouts = deals[:, :cards_needed_on_board]
+    final_boards = np.hstack([np.broadcast_to(np.array(board_ints, dtype=np.int64),
+                                              (num_deals, len(board_ints))), runouts])
+
+    # 1. Evaluate Hero's final 7-card hand score in every deal.
+    hero_hands = np.hstack([np.broadcast_to(np.array(hero_ints, dtype=np.int64), (num_deals, 2)),
+                            final_boards])
+    hero_scores = rank7_batch(hero_hands)
+
+    # 2. Evaluate all opponents' hands (2 hole cards each from the rest of the deal)
+    #    and keep the best score per deal (lowest numerical score). With no
+    #    opponents (num_players=1), the sentinel WORST_SCORE makes Hero always win.
+    if num_opponents > 0:
+        opp_holes = deals[:, cards_needed_on_board:].reshape(num_deals, num_opponents, 2)
+        opp_boards = np.broadcast_to(final_boards[:, None, :], (num_deals, num_opponents, 5))
+        opp_hands = np.concatenate([opp_holes, opp_boards], axis=2).reshape(-1, 7)
+        best_opponent_scores = rank7_batch(opp_hands).reshape(num_deals, num_opponents).min(axis=1)
     else:
-        # Scale to 0-100%
-        win_pct = (wins / iterations) * 100
+        best_opponent_scores = np.full(num_deals, WORST_SCORE)
+
+    # 3. Hero wins a deal outright by beating the best opponent and gets half a win
+    #    for tying it. Scale by the deals actually simulated (equal to iterations,
+    #    except on the turn where it is rounded per river).
+    wins = np.count_nonzero(hero_scores < best_opponent_scores) \
+        + 0.5 * np.count_nonzero(hero_scores == best_opponent_scores)
+    return float(wins / num_deals)
+
+
+def _deal_batch(deck, iterations, k):
+    """
+    Draws the first k cards of an independent random shuffle of `deck`, for every
+    iteration at once. Shuffling happens in NumPy instead of one random.shuffle per iteration.
+
+    Returns:
+        np.ndarray: int64 array of shape (iterations, k), each row k distinct cards in dealing order.
+    """
+    n = len(deck)
+    decks = np.tile(np.array(deck, dtype=np.int64), (iterations, 1))
+    rows = np.arange(iterations)
+    rand = np.random.random
+
+    # Partial Fisher-Yates, vectorized across iterations: only the first k positions
+    # are shuffled, so each iteration consumes k random numbers instead of n.
+    for i in range(k):
+        j = i + (rand(iterations) * (n - i)).astype(np.intp)
+        picked = decks[rows, j]
+        decks[rows, j] = decks[:, i]
+        decks[:, i] = picked
+
+    return decks[:, :k]
+
+
+def _deal_turn_batch(deck, iterations, num_opponents):
+    """
+    Deals for a turn simulation, stratified over the river: every card of `deck` is
+    used as the river in an equal number of deals (about iterations / len(deck)), and
+    only the opponents' hole cards are sampled from the rest of the deck.
+
+    Returns:
+        np.ndarray: int64 rows of [river] + 2 cards per opponent, grouped by river.
+    """
+    per_river = max(1, round(iterations / len(deck))) if iterations > 0 else 0
+    blocks = []
+    for r, river in enumerate(deck):
+        rest = deck[:r] + deck[r + 1:]
+        opp_cards = _deal_batch(rest, per_river, 2 * num_opponents)
+        blocks.append(np.hstack([np.full((per_river, 1), river, dtype=np.int64), opp_cards]))
+    return np.vstack(blocks)
 
-    return win_pct/100
 
 def evaluate_hand(hole_cards, community_cards):
     """
@@ -224,4 +459,96 @@ def evaluate_hand(hole_cards, community_cards):
     Returns:
         int: The numerical treys score of the player's best 5-card hand.
     """
-    return evaluate_best_hand(hole_cards + community_cards)
\ No newline at end of file
+    return evaluate_best_hand([CARD_INT[c] for c in hole_cards + community_cards])
+
+
+# ============================================================
+# 4. PREFLOP EQUITY TABLES
+# ============================================================
+#
+# Before the flop, equity against random opponents depends only on the field size and
+# which of the 169 canonical starting-hand classes Hero holds ("AA", "AKs", "72o", ...).
+# Each field size's table is simulated once when first needed, pickled next to this file
+# together with the others, and reused afterwards. At PREFLOP_TABLE_ITERATIONS deals per
+# class each entry carries roughly one percentage point of Monte Carlo standard error;
+# delete the pickle after raising the count to rebuild the tables more precisely.
+#
+# The flop is not tabulated the same way: hole cards and flop together still form about
+# 1.3 million suit-isomorphic classes per field size, far too many to simulate up front.
+# Flop equities are memoized per canonical spot by _cached_equity instead.
+
+PREFLOP_TABLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "preflop_equity.pkl")
+PREFLOP_TABLE_ITERATIONS = 3000
+
+# { num_players : { canonical class label : win probability (0..1) } }. Filled on first use.
+PREFLOP_EQUITY = {}
+
+# Serializes loading, building and saving the tables, so concurrent equity workers
+# neither simulate the same field size twice nor write the pickle at the same time.
+_preflop_lock = threading.Lock()
+
+
+def _canonical_class(hole):
+    """
+    Maps two hole cards to their canonical class label, e.g. ['Kd', 'Ah'] -> 'AKo'.
+    Ranks are ordered high to low; pairs get no suffix, others get 's' (suited) or 'o' (offsuit).
+    """
+    high, low = sorted(hole, key=lambda c: RANK_VALUE[c[0]], reverse=True)
+    if high[0] == low[0]:
+        return high[0] + low[0]
+    return high[0] + low[0] + ('s' if high[1] == low[1] else 'o')
+
+
+def _build_preflop_table(num_players):
+    """
+    Simulates one representative hand per canonical class against num_players - 1
+    opponents and returns the full table.
+    """
+    table = {}
+    for i, high in enumerate(RANKS):
+        for low in RANKS[:i + 1]:
+            if high == low:
+                classes = [(high + low, [high + 'h', low + 'd'])]
+            else:
+                classes = [(high + low + 's', [high + 'h', low + 'h']),
+                           (high + low + 'o', [high + 'h', low + 'd'])]
+            for label, hand in classes:
+                table[label] = _monte_carlo_equity(hand, [], num_players, PREFLOP_TABLE_ITERATIONS)
+    return table
+
+
+def _get_preflop_table(num_players):
+    """
+    Returns PREFLOP_EQUITY[num_players], loading the tables from PREFLOP_TABLE_PATH on
+    first use and simulating (and saving) the table of a field size not stored there yet.
+    """
+    table = PREFLOP_EQUITY.get(num_players)
+    if table is not None:
+        return table
+
+    with _preflop_lock:
+        if not PREFLOP_EQUITY:
+            try:
+                with open(PREFLOP_TABLE_PATH, "rb") as f:
+                    stored = pickle.load(f)
+                # Anything but a dict of tables (e.g. a stray pickle) is ignored and rebuilt.
+                if isinstance(stored, dict):
+                    PREFLOP_EQUITY.update(stored)
+            except (OSError, pickle.PickleError, EOFError):
+                pass
+
+        if num_players not in PREFLOP_EQUITY:
+            PREFLOP_EQUITY[num_players] = _build_preflop_table(num_players)
+            # Write a temporary file and swap it in, so readers never see a partial pickle.
+            tmp_path = f"{PREFLOP_TABLE_PATH}.{os.getpid()}.tmp"
+            try:
+                with open(tmp_path, "wb") as f:
+                    pickle.dump(PREFLOP_EQUITY, f)
+                os.replace(tmp_path, PREFLOP_TABLE_PATH)
+            except OSError:
+                # Read-only location: keep the in-memory tables for this process only.
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+        return PREFLOP_EQUITY[num_players]
\ No newline at end of file
@@ -0,0 +1,334 @@
+"""
+engine_fast.py
+
+Optional compiled Monte Carlo equity kernel used by engine_core.py:
+ - Treys-compatible 5/7-card hand ranking compiled over engine_tables' lookup tables.
+ - A Numba @njit(parallel=True) simulation loop that runs iterations across all cores.
+ - All kernels are compiled with nogil=True, and mc_equity serializes the parallel kernel
+   launches behind a lock (numba's workqueue threading layer aborts on concurrent launches),
+   so equity can be computed from background threads under any threading layer.
+ - Random deals come from persistent per-stream xoshiro256** generators instead of numba's np.random.
+ - Works purely on treys card ints (see engine_core.CARD_INT); engine_core converts at the boundary.
+
+If numba is not installed, importing this module raises ImportError and engine_core
+falls back to its NumPy-vectorized simulation. Results are the same up to Monte Carlo noise.
+"""
+
+import os
+import threading
+import numpy as np
+# Note: Ensure the 'numba' library is installed for the fast path: pip install numba
+import numba
+from numba import njit, prange
+# Lookup tables are treated as compile-time constants by numba.
+from engine_tables import (FLUSH7_LOOKUP, POPCOUNT13, SUIT_SHIFT, UNSUITED_KEYS,
+                           UNSUITED_RANKS, COMBOS_7_5, WORST_SCORE)
+
+
+# ============================================================
+# 1. COMPILED HAND RANKING
+# ============================================================
+
+@njit(cache=True, nogil=True)
+def flush_rank7(cards):
+    """
+    Flush rank of a 7-card int array, or 0 if it holds no 5 cards of one suit.
+    The cards are packed into a 52-bit mask (13 rank bits per suit) and each suit is
+    tested with one popcount; a flush always outranks anything else 7 cards can make.
+    """
+    hand = 0
+    for c in cards:
+        hand |= (c >> 16) << SUIT_SHIFT[(c >> 12) & 0xF]
+    for s in range(4):
+        suited = (hand >> (13 * s)) & 0x1FFF
+        if POPCOUNT13[suited] >= 5:
+            return FLUSH7_LOOKUP[suited]
+    return 0
+
+
+@njit(cache=True, nogil=True)
+def rank5_unsuited(c0, c1, c2, c3, c4):
+    """
+    Treys-compatible rank (lower is better) of 5 card ints already known not to be a flush,
+    looked up by the product of their rank primes.
+    """
+    prime = (c0 & 0xFF) * (c1 & 0xFF) * (c2 & 0xFF) * (c3 & 0xFF) * (c4 & 0xFF)
+    return UNSUITED_RANKS[np.searchsorted(UNSUITED_KEYS, prime)]
+
+
+@njit(cache=True, nogil=True)
+def rank7(cards):
+    """
+    Best (minimum) rank over the 21 five-card subsets of a 7-card int array.
+    """
+    return rank7_from(cards, 0, WORST_SCORE)
+
+
+@njit(cache=True, nogil=True)
+def rank7_prefix(cards, num_fixed):
+    """
+    Best unsuited rank over only the 5-card subsets lying entirely in cards[:num_fixed].
+    Computed once, it lets rank7_from skip those subsets on every later call.
+    """
+    best = WORST_SCORE
+    for i in range(21):
+        combo = COMBOS_7_5[i]
+        if combo[4] < num_fixed:
+            score = rank5_unsuited(cards[combo[0]], cards[combo[1]], cards[combo[2]],
+                                   cards[combo[3]], cards[combo[4]])
+            if score < best:
+                best = score
+    return best
+
+
+@njit(cache=True, nogil=True)
+def rank7_from(cards, num_fixed, prefix_best):
+    """
+    Same as rank7, given prefix_best = rank7_prefix(cards, num_fixed) for the unchanged
+    first num_fixed cards: only subsets touching the later cards are evaluated.
+    """
+    flush = flush_rank7(cards)
+    if flush:
+        return flush
+
+    best = prefix_best
+    for i in range(21):
+        combo = COMBOS_7_5[i]
+        if combo[4] >= num_fixed:
+            score = rank5_unsuited(cards[combo[0]], cards[combo[1]], cards[combo[2]],
+                                   cards[combo[3]], cards[combo[4]])
+            if score < best:
+                best = score
+    return best
+
+
+# ============================================================
+# 2. RANDOM NUMBER GENERATION
+# ============================================================
+#
+# xoshiro256**: 256 bits of state per stream and a handful of shifts, xors and
+# multiplies per draw. Each parallel chunk (or river) of a kernel owns one row of the
+# calling thread's state array (see _get_rng_state), so streams never share state and
+# continue from call to call.
+
+_MASK64 = (1 << 64) - 1
+
+
+def _seed_streams(num_streams):
+    """
+    Builds num_streams xoshiro256** states (uint64 array of shape (num_streams, 4)),
+    expanded with SplitMix64 from a single os.urandom seed.
+    """
+    x = int.from_bytes(os.urandom(8), "little")
+    words = np.empty(num_streams * 4, dtype=np.uint64)
+    for i in range(words.size):
+        x = (x + 0x9E3779B97F4A7C15) & _MASK64
+        z = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+        z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK64
+        words[i] = z ^ (z >> 31)
+    return words.reshape(num_streams, 4)
+
+
+# Only one parallel kernel may run at a time: numba's workqueue threading layer aborts the
+# process on concurrent launches. Each launch already spreads its work over every core,
+# so serializing costs little under the other layers.
+_KERNEL_LOCK = threading.Lock()
+
+# Kernels update the state rows in place. _KERNEL_LOCK is what makes calls from several
+# threads safe; each calling thread additionally gets its own independently seeded
+# array, so one thread's draws never depend on how often another has called in.
+_thread_state = threading.local()
+
+
+def _get_rng_state():
+    """
+    Returns the calling thread's xoshiro256** states, creating them on first use:
+    one stream per possible parallel chunk or river card.
+    """
+    try:
+        return _thread_state.rng
+    except AttributeError:
+        _thread_state.rng = _seed_streams(max(52, numba.config.NUMBA_NUM_THREADS))
+        return _thread_state.rng
+
+
+@njit(cache=True, nogil=True)
+def _rotl(x, k):
+    return (x << np.uint64(k)) | (x >> np.uint64(64 - k))
+
+
+@njit(cache=True, nogil=True)
+def _next_random(s):
+    """
+    Advances the xoshiro256** state s (4 uint64 words) in place and returns its next 64-bit output.
+    """
+    result = _rotl(s[1] * np.uint64(5), 7) * np.uint64(9)
+    t = s[1] << np.uint64(17)
+    s[2] ^= s[0]
+    s[3] ^= s[1]
+    s[1] ^= s[2]
+    s[0] ^= s[3]
+    s[2] ^= t
+    s[3] = _rotl(s[3], 45)
+    return result
+
+
+@njit(cache=True, nogil=True)
+def _random_below(s, bound):
+    """
+    Random int in [0, bound) from the top 32 bits of the next output (multiply-shift,
+    so no division; the bias is below bound / 2**32, negligible for a 52-card deck).
+    """
+    return np.int64(((_next_random(s) >> np.uint64(32)) * np.uint64(bound)) >> np.uint64(32))
+
+
+# ============================================================
+# 3. COMPILED MONTE CARLO LOOP
+# ============================================================
+
+@njit(cache=True, nogil=True)
+def _showdown_outcome(hero_score, opp7, deck, start, num_opponents):
+    """
+    Deals opponents their hole cards from deck[start:] into opp7 (whose board is already
+    filled) and returns Hero's outcome: 1.0 win, 0.5 tie with the best opponent, 0.0 loss.
+    """
+    # Stop at the first opponent that beats Hero; ties only halve the win.
+    outcome = 1.0
+    for o in range(num_opponents):
+        opp7[0] = deck[start + 2 * o]
+        opp7[1] = deck[start + 2 * o + 1]
+        score = rank7(opp7)
+        if score < hero_score:
+            return 0.0
+        if score == hero_score:
+            outcome = 0.5
+    return outcome
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _mc_wins(hero, board, deck, num_opponents, iterations, num_chunks, rng):
+    """
+    Runs `iterations` simulated deals split into `num_chunks` parallel chunks.
+    Each chunk owns a private copy of the deck and partially Fisher-Yates shuffles it,
+    drawing from its own random stream rng[chunk].
+
+    Returns:
+        float: Total wins, with ties against the best opponent counted as 0.5.
+    """
+    cards_needed_on_board = 5 - board.size
+    cards_per_deal = cards_needed_on_board + 2 * num_opponents
+    n = deck.size
+    chunk_wins = np.zeros(num_chunks, dtype=np.float64)
+
+    for chunk in prange(num_chunks):
+        local_deck = deck.copy()
+        state = rng[chunk]
+        hero7 = np.empty(7, dtype=np.int64)
+        opp7 = np.empty(7, dtype=np.int64)
+        hero7[0] = hero[0]
+        hero7[1] = hero[1]
+        for j in range(board.size):
+            hero7[2 + j] = board[j]
+            opp7[2 + j] = board[j]
+
+        # Hero's hole cards and the known board never change: score their
+        # 5-card subsets once so each iteration only ranks subsets with runout cards.
+        hero_fixed = 2 + board.size
+        hero_prefix_best = rank7_prefix(hero7, hero_fixed)
+
+        wins = 0.0
+        for _ in range(chunk, iterations, num_chunks):
+            # Only the first cards_per_deal positions need to be shuffled.
+            for i in range(cards_per_deal):
+                j = i + _random_below(state, n - i)
+                local_deck[i], local_deck[j] = local_deck[j], local_deck[i]
+
+            # Complete the board for Hero and every opponent.
+            for j in range(cards_needed_on_board):
+                hero7[2 + board.size + j] = local_deck[j]
+                opp7[2 + board.size + j] = local_deck[j]
+            hero_score = rank7_from(hero7, hero_fixed, hero_prefix_best)
+
+            wins += _showdown_outcome(hero_score, opp7, local_deck, cards_needed_on_board, num_opponents)
+        chunk_wins[chunk] = wins
+
+    return chunk_wins.sum()
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _turn_win_rates(hero, board, deck, num_opponents, per_river, rng):
+    """
+    Turn-only variant of _mc_wins: every card of `deck` is taken as the river exactly
+    once (in parallel), Hero is ranked once per river, and per_river opponent deals
+    are sampled from the cards left over, using the random stream rng[river index].
+
+    Returns:
+        np.ndarray: Win rate (ties as 0.5) for each river card, in deck order.
+    """
+    n = deck.size
+    rates = np.zeros(n, dtype=np.float64)
+
+    for r in prange(n):
+        rest = np.empty(n - 1, dtype=np.int64)
+        k = 0
+        for j in range(n):
+            if j != r:
+                rest[k] = deck[j]
+                k += 1
+
+        hero7 = np.empty(7, dtype=np.int64)
+        opp7 = np.empty(7, dtype=np.int64)
+        hero7[0] = hero[0]
+        hero7[1] = hero[1]
+        for j in range(4):
+            hero7[2 + j] = board[j]
+            opp7[2 + j] = board[j]
+        hero7[6] = deck[r]
+        opp7[6] = deck[r]
+        hero_score = rank7(hero7)
+
+        state = rng[r]
+        wins = 0.0
+        for _ in range(per_river):
+            for i in range(2 * num_opponents):
+                j = i + _random_below(state, n - 1 - i)
+                rest[i], rest[j] = rest[j], rest[i]
+            wins += _showdown_outcome(hero_score, opp7, rest, 0, num_opponents)
+        rates[r] = wins / per_river
+
+    return rates
+
+
+def mc_equity(hero_ints, board_ints, remaining_deck, num_opponents, iterations):
+    """
+    Compiled equivalent of engine_core's Monte Carlo loop.
+
+    Args:
+        hero_ints (list[int]): Hero's two hole cards as treys ints.
+        board_ints (list[int]): The visible community cards as treys ints.
+        remaining_deck (list[int]): Every card not in hero_ints or board_ints.
+        num_opponents (int): Number of opponents to deal 2 cards each.
+        iterations (int): The number of times to run the simulation.
+
+    Returns:
+        float: Win probability (0..1), ties counted as half a win.
+    """
+    cards_per_deal = 5 - len(board_ints) + 2 * num_opponents
+    if iterations <= 0 or cards_per_deal > len(remaining_deck):
+        return 0.0
+
+    hero = np.array(hero_ints, dtype=np.int64)
+    board = np.array(board_ints, dtype=np.int64)
+    deck = np.array(remaining_deck, dtype=np.int64)
+
+    if len(board_ints) == 4:
+        # Turn: enumerate the river exactly, giving each one an equal share of iterations.
+        per_river = max(1, round(iterations / len(remaining_deck)))
+        with _KERNEL_LOCK:
+            rates = _turn_win_rates(hero, board, deck, num_opponents, per_river, _get_rng_state())
+        return float(rates.mean())
+
+    with _KERNEL_LOCK:
+        wins = _mc_wins(hero, board, deck, num_opponents, iterations,
+                        min(numba.get_num_threads(), iterations), _get_rng_state())
+    return wins / iterations
@@ -0,0 +1,90 @@
+"""
+engine_tables.py
+
+Hand-ranking lookup tables shared by engine_core.py and engine_fast.py:
+ - Treys-compatible 5-card rank tables rebuilt as NumPy arrays.
+ - rank7_batch(), a NumPy-vectorized 7-card ranker for many hands at once.
+ - Needs only numpy and treys, so it is always available (unlike the numba kernel).
+
+Ranks match treys exactly: 1 = Royal Flush ... 7462 = 7-high, lower is better.
+"""
+
+import itertools
+import numpy as np
+from treys import Card
+from treys.lookup import LookupTable
+
+
+# ============================================================
+# 1. LOOKUP TABLES
+# ============================================================
+#
+# Built once at import from treys' own tables. Cards are treys ints:
+#   bits 16-28 = rank bit, bits 12-15 = suit, bits 0-7 = rank prime.
+
+_table = LookupTable()
+
+# Flushes are indexed directly by the 13-bit OR of the 5 cards' rank bits.
+FLUSH_LOOKUP = np.zeros(1 << 13, dtype=np.int32)
+for _bits in range(1 << 13):
+    if bin(_bits).count("1") == 5:
+        FLUSH_LOOKUP[_bits] = _table.flush_lookup[Card.prime_product_from_rankbits(_bits)]
+
+# Everything else is keyed by the product of the 5 rank primes; searched by bisection.
+_unsuited = sorted(_table.unsuited_lookup.items())
+UNSUITED_KEYS = np.array([k for k, _ in _unsuited], dtype=np.int64)
+UNSUITED_RANKS = np.array([v for _, v in _unsuited], dtype=np.int32)
+
+# Bit counts of every 13-bit rank mask.
+POPCOUNT13 = np.array([bin(_bits).count("1") for _bits in range(1 << 13)], dtype=np.int32)
+
+# Best flush (straight flushes included) among any 5 ranks of a mask of 5 or more suited
+# ranks: each entry is the best of the masks with one rank removed, so it builds upwards.
+FLUSH7_LOOKUP = FLUSH_LOOKUP.copy()
+for _bits in range(1 << 13):
+    if POPCOUNT13[_bits] > 5:
+        FLUSH7_LOOKUP[_bits] = min(FLUSH7_LOOKUP[_bits & ~(1 << i)] for i in range(13) if _bits >> i & 1)
+
+# A 7-card hand is also packed into one 52-bit mask, 13 rank bits per suit:
+#   bit (SUIT_SHIFT[suit nibble] + rank) is set for every card held.
+# With 5+ cards of one suit among 7, no full house or quads is possible, so the flush
+# (looked up in FLUSH7_LOOKUP) is the hand's rank and the other 21 subsets are skipped.
+SUIT_SHIFT = np.zeros(16, dtype=np.int64)
+SUIT_SHIFT[[1, 2, 4, 8]] = [0, 13, 26, 39]
+SUIT_MASK = np.array([0x1FFF << (13 * s) for s in range(4)], dtype=np.int64)
+
+# The 21 ways of choosing 5 of 7 card positions.
+COMBOS_7_5 = np.array(list(itertools.combinations(range(7), 5)), dtype=np.int64)
+
+# The worst possible score in treys is 7462, use 7463 as the sentinel.
+WORST_SCORE = 7463
+
+
+# ============================================================
+# 2. VECTORIZED HAND RANKING
+# ============================================================
+
+def rank7_batch(cards):
+    """
+    Ranks many 7-card hands at once, each as the best of its 21 five-card subsets.
+
+    Args:
+        cards (np.ndarray): int64 array of shape (M, 7) holding treys card ints.
+
+    Returns:
+        np.ndarray: int32 array of shape (M,) with the treys score of every hand.
+    """
+    # Flushes first: pack each hand into its 52-bit mask and test each suit's 13 bits.
+    hand = np.bitwise_or.reduce((cards >> 16) << SUIT_SHIFT[(cards >> 12) & 0xF], axis=1)
+    flush_rank = np.zeros(len(cards), dtype=np.int32)
+    for suit_mask, shift in zip(SUIT_MASK, range(0, 52, 13)):
+        suited = (hand & suit_mask) >> shift
+        flush_rank = np.where(POPCOUNT13[suited] >= 5, FLUSH7_LOOKUP[suited], flush_rank)
+
+    # Every other hand is the best unsuited rank of its 21 five-card subsets.
+    best = np.full(len(cards), WORST_SCORE, dtype=np.int32)
+    primes = cards & 0xFF
+    for combo in COMBOS_7_5:
+        prime = np.prod(primes[:, combo], axis=1)
+        np.minimum(best, UNSUITED_RANKS[np.searchsorted(UNSUITED_KEYS, prime)], out=best)
+    return np.where(flush_rank != 0, flush_rank, best)
@@ -11,8 +11,8 @@ It handles:
 # Import necessary components from the core engine file
 # This gives us access to configuration, classes, and poker math functions.
 from engine_core import (
-    NUM_GAMES, STARTING_STACK, BUY_IN, PLAYER_NAMES, PlayerState,
-    create_deck, calculate_multiplayer_equity, evaluate_hand,
+    NUM_GAMES, STARTING_STACK, BUY_IN, PLAYER_NAMES, MatchState, PlayerState,
+    create_deck, calculate_multiplayer_equities, evaluate_hand,
 )
 
 # Import the pre-loaded strategy objects from the strategy file.
@@ -22,10 +22,11 @@ from dummy_strategies import (
 )
 
 # Import standard library components needed for the game loop
-import random
 import copy
+import logging
 import sys
 import itertools
+import numpy as np
 
 
 # ============================================================
@@ -35,17 +36,122 @@ import itertools
 # These were already loaded/replaced by the logic in dummy_strategies.py.
 PLAYERS = [strategyA, strategyB, strategyC, strategyD, strategyE]
 
+# Per-game progress is logged rather than printed, so it costs nothing unless enabled:
+# INFO reports game results, DEBUG adds every deal, equity and bet.
+log = logging.getLogger(__name__)
+
+# Random generator used to shuffle the deck for every game.
+rng = np.random.default_rng()
+
 
 # ============================================================
 # 2. MAIN GAME LOOP: play_match()
 # ============================================================
 
+def _truncated_history(players, community_cards, pot):
+    """
+    Builds the match_history entry for a game that ended before the showdown.
+    Strategies keep every entry for the rest of the match, so a new one is built per game.
+    """
+    round_history = {}
+    for p in players:
+        # Note: final_score is dummy and final_bet is 0 if no showdown.
+        round_history[p.index] = {
+            "hole_cards": p.hole_cards,
+            "final_score": 7463, 
+            "folded": p.has_folded,
+            "final_bet": 0, 
+            "equities": p.round_equities,
+            "stack": p.stack
+        }
+    round_history["community_cards"] = community_cards[:3] # Log only visible cards.
+    round_history["pot_final"] = pot
+    return round_history
+
+
+def _betting_round(round_num, players, state, indices, visible_community, decide, min_bets, max_bets, bets, pot):
+    """
+    Plays one betting round, fused into a single pass: one equity batch for all players,
+    then each player's decision, clamped bet and pot update, then one array update of
+    every stack and bet.
+
+    Players act in turn, and each one's strategy sees the pot including the bets made
+    before it in this round, so decisions are taken one at a time.
+
+    Args:
+        round_num (int): The betting round (1-3), for logging.
+        players (list[PlayerState]): All players of the match.
+        state (MatchState): The players' shared numeric state.
+        indices (list[int]): Indices of the players betting in this round, in turn order.
+        visible_community (list[str]): The community cards visible in this round.
+        decide (callable): decide(player, pot, win_prob) -> (action, bet value), where
+            action is "fold" or "play". Only Round 1 offers a fold; later rounds always play.
+        min_bets (np.ndarray): Smallest allowed bet of each player in `indices`.
+        max_bets (np.ndarray): Largest allowed bet of each player in `indices` (before the stack cap).
+        bets (np.ndarray): The MatchState bet array this round's bets are recorded in.
+        pot (float): The pot before this round.
+
+    Returns:
+        float: The pot after this round.
+    """
+    # The equities do not depend on each other's decisions, so they are computed in one batch.
+    # The calculation considers all players betting in this round.
+    equities = calculate_multiplayer_equities([players[idx].hole_cards for idx in indices],
+                                              visible_community, num_players=len(indices))
+
+    # Precompute every player's final bet range once: the stack cap is folded into both
+    # bounds, so each bet below is one clamp. (Clamping to [min, max] and then capping at
+    # the stack gives the same result.)
+    idx_arr = np.array(indices, dtype=np.intp)
+    player_stacks = state.stacks[idx_arr]
+    lo = np.minimum(min_bets, player_stacks)
+    hi = np.minimum(max_bets, player_stacks)
+
+    prices = np.zeros(len(indices))
+    bounds = zip(lo.tolist(), hi.tolist())
+    for k, (idx, win_prob, (min_p, max_p)) in enumerate(zip(indices, equities, bounds)):
+        p = players[idx]
+        action, val = decide(p, pot, win_prob)
+
+        if action == "fold":
+            p.has_folded = True
+            log.debug("Equity: %.2f%%, %s chose to fold.", win_prob * 100, p.name)
+        else:
+            price = max(min_p, min(max_p, float(val)))
+            prices[k] = price
+            pot += price
+            if round_num == 1:
+                log.debug("Equity: %.2f%%, %s chose to bet $%.2f.", win_prob * 100, p.name, price)
+            else:
+                log.debug("Equity: %.2f%%, %s bet %.2f in round %d", win_prob * 100, p.name, price, round_num)
+
+        # Log the equity for history.
+        p.round_equities.append(win_prob)
+
+    # Record and pay every bet of the round at once (0 for players who folded).
+    bets[idx_arr] = prices
+    state.stacks[idx_arr] -= prices
+    return pot
+
+
 def play_match():
     """
     Runs the entire tournament simulation across NUM_GAMES.
     """
+    # Bind engine constants and helpers to locals once: the game loop below reads
+    # them constantly, and local lookups are cheaper than module-global ones.
+    _num_games = NUM_GAMES
+    _buy_in = BUY_IN
+    _evaluate_hand = evaluate_hand
+
+    # Numeric state (stacks, bets, folds) of all players, as arrays indexed by player index.
+    # The game loop updates whole rounds of players at once through these arrays.
+    state = MatchState.new(len(PLAYERS))
+    stacks = state.stacks
+
     # Create PlayerState objects, one for each strategy, binding them to a name and index.
-    players = [PlayerState(name, strat, i) for i, (name, strat) in enumerate(zip(PLAYER_NAMES, PLAYERS))]
+    # Each one is a view onto its entries of `state`.
+    players = [PlayerState(name, strat, i, state) for i, (name, strat) in enumerate(zip(PLAYER_NAMES, PLAYERS))]
     
     # CRITICAL SETUP: Assign each strategy its index (0-4) for internal reference.
     # This is how strategies identify their own data in lists (stacks, bets).
@@ -62,9 +168,16 @@ def play_match():
     # Current number of players actively participating in the match.
     current_num_players = len(players)
 
+    # Round 1 bet range, the same for every player: [100, 300].
+    r1_min = np.full(len(players), 100.0)
+    r1_max = np.full(len(players), 300.0)
+
+    # The unshuffled deck never changes; each game deals from a fresh permutation of it.
+    deck = create_deck()
+
     # --- Start Game Loop ---
-    for game_num in range(1, NUM_GAMES + 1):
-        print(f"\n--- Starting Game {game_num} ---")
+    for game_num in range(1, _num_games + 1):
+        log.info("--- Starting Game %d ---", game_num)
 
         # Call the external initialization hook for each strategy.
         # This allows strategies to update their internal opponent models 
@@ -75,101 +188,87 @@ def play_match():
         # ------------------------------------------------------------
         # ROUND 0: Setup and Buy-in
         # ------------------------------------------------------------
-        print("\n", "\n", "Round 0 starting: Buy-ins and Dealing")
+        log.debug("Round 0 starting: Buy-ins and Dealing")
         pot = 0
-        deck = create_deck()
-        random.shuffle(deck)
+        order = rng.permutation(len(deck)).tolist()
+        next_card = 0
         community_cards = []
-        active_players_indices = []
+
+        # Reset all per-game state (bets, fold status) of every player at once.
+        state.reset_round()
 
         for p in players:
-            # Reset all per-game state (cards, bets, fold status)
+            # Reset the per-game cards and equity log.
             p.reset_round()
-            
-            # Skip players who were previously eliminated.
-            if p.is_lost_match:
-                continue
-
-            # Check if player can afford the BUY_IN.
-            if p.stack < BUY_IN:
-                # Elimination: Player cannot afford the buy-in.
-                print(f"{p.name} eliminated! Stack ({p.stack:.2f}) < {BUY_IN}.")
-                pot += p.stack # Any remaining stack is added to the pot for logging (but stack becomes 0)
-                p.stack = 0
-                p.is_lost_match = True
-            else:
-                # Player is active this game: pay buy-in and receive cards.
-                p.stack -= BUY_IN
-                pot += BUY_IN
-                p.hole_cards = [deck.pop(), deck.pop()]
-                print(f"{p.name} is dealt: {p.hole_cards}")
-                active_players_indices.append(p.index)
+
+        # Buy-ins for every player at once, with masks instead of per-player branches.
+        # Previously eliminated players are skipped; the rest either pay the BUY_IN or,
+        # if they cannot afford it, are eliminated.
+        alive = ~state.is_lost_match
+        can_afford = stacks >= _buy_in
+        in_game = alive & can_afford
+        broke = alive & ~can_afford
+
+        # Elimination: Player cannot afford the buy-in.
+        for idx in np.flatnonzero(broke):
+            log.info("%s eliminated! Stack (%.2f) < %d.", players[idx].name, stacks[idx], _buy_in)
+
+        # Any remaining stack of an eliminated player is added to the pot for logging (but stack becomes 0).
+        pot += float(stacks[broke].sum()) + _buy_in * int(in_game.sum())
+        stacks[:] = np.where(in_game, stacks - _buy_in, np.where(broke, 0.0, stacks))
+        state.is_lost_match |= broke
+
+        # Players active this game receive their cards, in player order.
+        active_players_indices = np.flatnonzero(in_game).tolist()
+        for idx in active_players_indices:
+            p = players[idx]
+            p.hole_cards = [deck[order[next_card]], deck[order[next_card + 1]]]
+            next_card += 2
+            log.debug("%s is dealt: %s", p.name, p.hole_cards)
 
         # Deal the conceptual 5 community cards now (to be revealed later).
-        community_cards = [deck.pop() for _ in range(5)]
-        print(f"The community cards are: {community_cards}")
+        community_cards = [deck[i] for i in order[next_card:next_card + 5]]
+        log.debug("The community cards are: %s", community_cards)
 
         # Safety Check: Stop if not enough competitors remain.
         if len(active_players_indices) < 2:
-            print("Not enough players to continue match.")
+            log.info("Not enough players to continue match.")
             break
 
         # ------------------------------------------------------------
         # ROUND 1: FLOP BETTING (3 community cards shown)
         # ------------------------------------------------------------
         visible_community = community_cards[:3]
-        print("\n", "\n", "Round 1 starting: Flop Betting")
-        print(f"Visible Community Cards for Round 1 (Flop): {visible_community}")
+        log.debug("Round 1 starting: Flop Betting")
+        log.debug("Visible Community Cards for Round 1 (Flop): %s", visible_community)
         
-        # Determine who is eligible to bet in R1 (must afford minimum bet of 100).
-        round1_active_indices = []
-        current_stacks = [p.stack for p in players] # Snapshot of stacks before betting.
-
-        for idx in active_players_indices:
-            p = players[idx]
-            if p.stack < 100:
-                 # Elimination: Player cannot afford the R1 minimum bet.
-                 print(f"{p.name} eliminated! Stack ({p.stack:.2f}) < 100.")
-                 pot += p.stack
-                 p.stack = 0
-                 p.is_lost_match = True
-            else:
-                 round1_active_indices.append(idx)
-
-        # r1_bets tracks the amount bet in R1 by each player (0 if folded/inactive).
-        r1_bets = {idx: 0 for idx in range(len(players))}
-
-        # Each active player makes a decision.
-        for idx in round1_active_indices:
-            p = players[idx]
+        current_stacks = stacks.tolist() # Snapshot of stacks before betting.
 
-            # Calculate Hero's win probability on the current board (Flop).
-            # The calculation considers all players active at the start of the game (current_num_players).
-            win_prob = calculate_multiplayer_equity(p.hole_cards, visible_community, num_players=len(round1_active_indices))
+        # Determine who is eligible to bet in R1 (must afford minimum bet of 100), again with masks.
+        short = in_game & (stacks < 100)
 
-            print(f"Equity: {win_prob*100:.2f}%, {p.name}", end=' ')
+        # Elimination: Player cannot afford the R1 minimum bet.
+        for idx in np.flatnonzero(short):
+            log.info("%s eliminated! Stack (%.2f) < 100.", players[idx].name, stacks[idx])
+        pot += float(stacks[short].sum())
+        stacks[short] = 0
+        state.is_lost_match |= short
+        round1_active_indices = np.flatnonzero(in_game & ~short).tolist()
 
+        def decide_r1(p, pot, win_prob):
             # STRATEGY CALL: Get the Round 1 decision.
-            action, val = p.strategy.round1(p.hole_cards, visible_community, current_stacks, pot, win_prob)
+            return p.strategy.round1(p.hole_cards, visible_community, current_stacks, pot, win_prob)
 
-            if action == "fold":
-                p.has_folded = True
-                print(" chose to fold.")
-            else:
-                # Engine enforces bet range: [100, 300].
-                price = max(100.0, min(300.0, float(val)))
-                
-                # Cannot bet more than current stack.
-                price = min(price, p.stack)
-
-                p.current_bet_r1 = price
-                r1_bets[idx] = price
-                p.stack -= price
-                pot += price
-                print(f" chose to bet ${price:.2f}.")
-            
-            # Log the equity for history.
-            p.round_equities.append(win_prob)
+        # Engine enforces bet range: [100, 300] (see r1_min / r1_max).
+        num_r1_players = len(round1_active_indices)
+        pot = _betting_round(1, players, state, round1_active_indices, visible_community, decide_r1,
+                             r1_min[:num_r1_players], r1_max[:num_r1_players],
+                             state.current_bet_r1, pot)
+
+        # r1_bets tracks the amount bet in R1 by each player (0 if folded/inactive), indexed
+        # by player index. Strategies get a read-only view of the bet array instead of a copy.
+        r1_bets = state.current_bet_r1.view()
+        r1_bets.flags.writeable = False
 
         # After Round 1, check how many players are still in.
         round1_post_fold_indices = [i for i in round1_active_indices if not players[i].has_folded]
@@ -181,155 +280,98 @@ def play_match():
             
             # Winning Cap calculation uses R1 bet as the base for early termination.
             winner_bet = winner.current_bet_r1 
-            winning_cap = 4 * (BUY_IN + winner_bet)
+            winning_cap = 4 * (_buy_in + winner_bet)
             actual_win = min(winning_cap, pot)
             
             # Pay winner and log.
             winner.stack += actual_win
             no_of_wins[winner.index] += 1
             
-            print("\n*** EARLY WINNER (Fold Equity) ***")
-            print(f"{winner.name} wins by fold! Pot: ${pot:.2f}. Payout: ${actual_win:.2f}")
+            log.info("*** EARLY WINNER (Fold Equity) ***")
+            log.info("%s wins by fold! Pot: $%.2f. Payout: $%.2f", winner.name, pot, actual_win)
 
-            # Prepare truncated history log.
-            round_history = {}
-            for p in players:
-                # Note: final_score is dummy and final_bet is 0 if no showdown.
-                round_history[p.index] = {
-                    "hole_cards": p.hole_cards,
-                    "final_score": 7463, 
-                    "folded": p.has_folded,
-                    "final_bet": 0, 
-                    "equities": p.round_equities,
-                    "stack": p.stack
-                }
-            round_history["community_cards"] = community_cards[:3] # Log only visible cards.
-            round_history["pot_final"] = pot
-            match_history.append(round_history)
-
-            # Print end-of-game stacks and move to next game.
+            # Log the truncated history of this game.
+            match_history.append(_truncated_history(players, community_cards, pot))
+
+            # Log end-of-game stacks and move to next game.
             for p in players:
-                print(f"{p.name}: ${p.stack:.2f}")
+                log.debug("%s: $%.2f", p.name, p.stack)
             continue
 
         # ------------------------------------------------------------
         # ROUND 2: TURN BETTING (4 community cards visible)
         # ------------------------------------------------------------
         visible_community = community_cards[:4]
-        print("\n", "\n", "Round 2 starting: Turn Betting")
-        print(f"Visible Community Cards for Round 2 (Turn): {visible_community}")
+        log.debug("Round 2 starting: Turn Betting")
+        log.debug("Visible Community Cards for Round 2 (Turn): %s", visible_community)
         
         # Only players who *did not fold* in Round 1 can proceed.
         round2_active_indices = round1_post_fold_indices
 
-        # r2_bets tracks the amount bet in R2.
-        r2_bets = {idx: 0 for idx in range(len(players))}
-        
         # Number of players currently in the hand (used for equity calculation).
         num_r2_players = len(round2_active_indices)
         if num_r2_players == 0:
-            print("No players remain in Round 2.")
-            # Prepare truncated history log.
-            round_history = {}
-            for p in players:
-                # Note: final_score is dummy and final_bet is 0 if no showdown.
-                round_history[p.index] = {
-                    "hole_cards": p.hole_cards,
-                    "final_score": 7463, 
-                    "folded": p.has_folded,
-                    "final_bet": 0, 
-                    "equities": p.round_equities,
-                    "stack": p.stack
-                }
-            round_history["community_cards"] = community_cards[:3] # Log only visible cards.
-            round_history["pot_final"] = pot
-            match_history.append(round_history)
-
-            # Print end-of-game stacks and move to next game.
+            log.info("No players remain in Round 2.")
+            # Log the truncated history of this game.
+            match_history.append(_truncated_history(players, community_cards, pot))
+
+            # Log end-of-game stacks and move to next game.
             for p in players:
-                print(f"{p.name}: ${p.stack:.2f}")
+                log.debug("%s: $%.2f", p.name, p.stack)
             continue
 
 
-        for idx in round2_active_indices:
-            p = players[idx]
-
-            # Recalculate win probability on the Turn (4 community cards).
-            win_prob = calculate_multiplayer_equity(p.hole_cards, visible_community, num_players=num_r2_players)
-
-            # STRATEGY CALL: Round 2 decision (returns a single bet value).
-            val = p.strategy.round2(p.hole_cards, visible_community, r1_bets, current_stacks, pot, win_prob)
-
-            # Engine enforces bet range relative to R1 bet: 
-            #   0.5 * R1 <= R2 <= 1.5 * R1
-            min_p = p.current_bet_r1 * 0.5
-            max_p = p.current_bet_r1 * 1.5
-            price = max(min_p, min(max_p, float(val)))
-
-            # Cap bet at remaining stack.
-            price = min(price, p.stack)
+        def decide_r2(p, pot, win_prob):
+            # STRATEGY CALL: Round 2 decision (returns a single bet value; there is no fold).
+            return "play", p.strategy.round2(p.hole_cards, visible_community, r1_bets, current_stacks, pot, win_prob)
 
-            print(f"Equity: {win_prob*100:.2f}%, {p.name} bet {price:.2f} in round 2")
-
-            p.current_bet_r2 = price
-            r2_bets[idx] = price
-            p.stack -= price
-            pot += price
+        # Engine enforces bet range relative to R1 bet: 
+        #   0.5 * R1 <= R2 <= 1.5 * R1
+        r2_indices = np.array(round2_active_indices, dtype=np.intp)
+        r1_of_r2_players = state.current_bet_r1[r2_indices]
+        pot = _betting_round(2, players, state, round2_active_indices, visible_community, decide_r2,
+                             r1_of_r2_players * 0.5, r1_of_r2_players * 1.5,
+                             state.current_bet_r2, pot)
 
-            # Log Round 2 equity.
-            p.round_equities.append(win_prob)
+        # r2_bets tracks the amount bet in R2, as a read-only view indexed by player index.
+        r2_bets = state.current_bet_r2.view()
+        r2_bets.flags.writeable = False
 
 
         # ------------------------------------------------------------
         # ROUND 3: RIVER BETTING (all 5 community cards visible)
         # ------------------------------------------------------------
         visible_community = community_cards
-        print("\n", "\n", "Round 3 starting: River Betting")
-        print(f"Visible Community Cards for Round 3 (River): {visible_community}")
+        log.debug("Round 3 starting: River Betting")
+        log.debug("Visible Community Cards for Round 3 (River): %s", visible_community)
         
         # Players active in R2 proceed to R3.
         num_r3_players = len(round2_active_indices)
         if num_r3_players == 0:
             continue
             
-        for idx in round2_active_indices:
-            p = players[idx]
-
-            # Final win probability using the full board (River).
-            win_prob = calculate_multiplayer_equity(p.hole_cards, visible_community, num_players=num_r3_players)
-
-            # STRATEGY CALL: Round 3 decision (returns a single bet value).
-            val = p.strategy.round3(p.hole_cards, visible_community, r1_bets, r2_bets, current_stacks, pot, win_prob)
-
-            # Engine enforces bet range relative to R2 bet: 
-            #   0.75 * R2 <= R3 <= 1.25 * R2
-            min_p = p.current_bet_r2 * 0.75
-            max_p = p.current_bet_r2 * 1.25
-            price = max(min_p, min(max_p, float(val)))
-
-            # Cap bet at remaining stack.
-            price = min(price, p.stack)
-
-            print(f"Equity: {win_prob*100:.2f}%, {p.name} bet {price:.2f} in round 3")
-
-            # Finalize Round 3 bet (this is the final bet used for pot cap).
-            p.final_round_bet = price
-            p.stack -= price
-            pot += price
-
-            # Log Round 3 equity.
-            p.round_equities.append(win_prob)
+        def decide_r3(p, pot, win_prob):
+            # STRATEGY CALL: Round 3 decision (returns a single bet value; there is no fold).
+            return "play", p.strategy.round3(p.hole_cards, visible_community, r1_bets, r2_bets, current_stacks, pot, win_prob)
+
+        # Engine enforces bet range relative to R2 bet: 
+        #   0.75 * R2 <= R3 <= 1.25 * R2
+        # The Round 3 bet is the final bet used for the pot cap.
+        r2_of_r3_players = state.current_bet_r2[r2_indices]
+        pot = _betting_round(3, players, state, round2_active_indices, visible_community, decide_r3,
+                             r2_of_r3_players * 0.75, r2_of_r3_players * 1.25,
+                             state.final_round_bet, pot)
 
         # ------------------------------------------------------------
         # 3. SHOWDOWN & POT ALLOCATION
         # ------------------------------------------------------------
-        print("\n", "\n", "Showdown & Pot Allocation")
+        log.debug("Showdown & Pot Allocation")
 
-        best_score = 7463 # Worst possible hand score in treys.
-        winners = []
         round_history = {} 
 
-        # Step 1: Evaluate hands for all players who did not fold.
+        # Step 1: Evaluate hands for all players who did not fold. Everyone else keeps the
+        # worst possible treys score (7463) so that they can never be among the winners.
+        final_scores = np.full(len(players), 7463, dtype=np.int32)
         for idx in active_players_indices:
             p = players[idx]
             score = 0
@@ -337,15 +379,9 @@ def play_match():
             
             if not is_folded:
                 # Calculate the final hand score (lower is better).
-                score = evaluate_hand(p.hole_cards, community_cards)
+                score = _evaluate_hand(p.hole_cards, community_cards)
                 p.hand_score = score
-                
-                # Determine the best hand(s).
-                if score < best_score:
-                    best_score = score
-                    winners = [p]
-                elif score == best_score:
-                    winners.append(p)
+                final_scores[idx] = score
             
             # Log player data regardless of fold status.
             round_history[p.index] = {
@@ -357,26 +393,30 @@ def play_match():
                 "stack": p.stack
             }
 
-        if not winners:
-            print("Error: No winner determined in showdown.")
+        # Determine the best hand(s).
+        best_score = int(final_scores.min())
+        if best_score == 7463:
+            log.error("No winner determined in showdown.")
             continue
+        winner_indices = np.flatnonzero(final_scores == best_score)
+        winners = [players[i] for i in winner_indices]
 
         # Step 2: Split Pot among winners and Apply Winning Cap.
         num_winners = len(winners)
         winning_pot_share_max = pot / num_winners # What each winner would get without a cap.
-        total_win = 0
-        
-        for winner in winners:
-            # Record the win (fractional if drawn).
-            no_of_wins[winner.index] += 1 / num_winners
-            
-            # Winning cap logic: max payout = 4 * (BUY_IN + final_round_bet)
-            winning_cap = 4 * (BUY_IN + winner.current_bet_r1 + winner.current_bet_r2 + winner.final_round_bet)
-            actual_win_for_winner = min(winning_cap, winning_pot_share_max)
-            
-            # Distribute capped winnings.
-            winner.stack += actual_win_for_winner
-            total_win += actual_win_for_winner
+
+        # Record the win (fractional if drawn).
+        for i in winner_indices:
+            no_of_wins[i] += 1 / num_winners
+
+        # Winning cap logic: max payout = 4 * (BUY_IN + all of the winner's bets)
+        winning_caps = 4 * (_buy_in + state.current_bet_r1[winner_indices] + state.current_bet_r2[winner_indices]
+                            + state.final_round_bet[winner_indices])
+        actual_wins = np.minimum(winning_caps, winning_pot_share_max)
+
+        # Distribute capped winnings.
+        stacks[winner_indices] += actual_wins
+        total_win = float(actual_wins.sum())
 
         remaining_pot = pot - total_win
 
@@ -389,27 +429,26 @@ def play_match():
         winner_names = ", ".join([w.name for w in winners])
 
         if num_winners > 1:
-            print(f"**DRAW!** Winners: {winner_names} all share Hand Score {best_score}")
+            log.info("**DRAW!** Winners: %s all share Hand Score %d", winner_names, best_score)
         else:
-            print(f"Winner: {winner_names} with Hand Score {best_score}")
+            log.info("Winner: %s with Hand Score %d", winner_names, best_score)
 
-        print(f"Total Pot: {pot:.2f}, Total Win Amount Distributed: {total_win:.2f}")
+        log.info("Total Pot: %.2f, Total Win Amount Distributed: %.2f", pot, total_win)
         
         # Step 3: Redistribution Law
         # Any pot left over due to the cap is redistributed evenly among 
         # players who reached the River (i.e., active in Round 3 / Round 2).
         if remaining_pot > 0:
-            recipients = [players[i] for i in round2_active_indices] # Players who were active in R2/R3.
-            if recipients:
+            recipients = r2_indices # Players who were active in R2/R3.
+            if len(recipients):
                 share = remaining_pot / len(recipients)
-                print(f"Redistributing {remaining_pot:.2f} ({share:.2f} each) to {len(recipients)} late-round players.")
-                for p in recipients:
-                    p.stack += share
+                log.info("Redistributing %.2f (%.2f each) to %d late-round players.", remaining_pot, share, len(recipients))
+                stacks[recipients] += share
 
-        # Print stacks after this game.
-        print("\nGame End Stacks:")
+        # Log stacks after this game.
+        log.debug("Game End Stacks:")
         for p in players:
-            print(f"{p.name}: ${p.stack:.2f}")
+            log.debug("%s: $%.2f", p.name, p.stack)
 
     # ========================================================
     # 4. FINAL RESULTS
@@ -432,4 +471,5 @@ def play_match():
 
 # Standard Python entry-point pattern: run the tournament if main.py is executed directly.
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING, format="%(message)s")
     play_match()
\ No newline at end of file
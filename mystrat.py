@@ -23,11 +23,10 @@ class Fujin:
         # 1. Final calculated strength (0-1) for each player.
         self.opponent_strengths = [0.0] * self.NUM_PLAYERS
         
-        # 2. Looseness tracking (Used for _calculate_opponent_strength and R1 logic)
-        self.looseness_tracker = {
-            i: {"games_seen": 0, "games_played": 0} 
-            for i in range(self.NUM_PLAYERS)
-        }
+        # 2. Looseness tracking (Used for _calculate_opponent_strength and R1 logic):
+        #    per player, the games they were dealt into and the games they did not fold.
+        self.games_seen = np.zeros(self.NUM_PLAYERS, dtype=np.int32)
+        self.games_played = np.zeros(self.NUM_PLAYERS, dtype=np.int32)
 
 
     def initialize_game(self, match_history, current_game_num):
@@ -54,12 +53,10 @@ class Fujin:
             p_data = last_game.get(pid_int)
             if p_data is None: continue
                 
-            profile = self.looseness_tracker.get(pid_int)
-            
-            if p_data.get("hole_cards") and profile is not None:
-                profile["games_seen"] += 1
+            if p_data.get("hole_cards"):
+                self.games_seen[pid_int] += 1
                 if not p_data.get("folded", True):
-                    profile["games_played"] += 1
+                    self.games_played[pid_int] += 1
 
 
     def _calculate_opponent_strength_final(self, match_history):
@@ -68,75 +65,66 @@ class Fujin:
         1. Equity-Normalized Aggression (V-Factor)
         2. Looseness (L_i)
         3. Hand Weakness Bonus (H_it)
+
+        The last game's stats are gathered into arrays once, then every player's
+        score is computed in a single pass of elementwise NumPy operations.
         """
-        opponent_strengths = [0.0] * self.NUM_PLAYERS
-        
         # Only consider the last game
         if not match_history:
-            return opponent_strengths 
+            return [0.0] * self.NUM_PLAYERS
 
         game_data = match_history[-1]
-        
+
+        # Per-player stats from the last game. Players who were not active in it
+        # (and Fujin itself) keep active=False, so their strength defaults to 0.0.
+        active = np.zeros(self.NUM_PLAYERS, dtype=bool)
+        is_folded = np.ones(self.NUM_PLAYERS, dtype=bool)
+        total_bets = np.zeros(self.NUM_PLAYERS)
+        r3_win_prob = np.zeros(self.NUM_PLAYERS)
+        final_score = np.full(self.NUM_PLAYERS, self.MAX_SCORE_TREYS)
+
         for i in range(self.NUM_PLAYERS):
             if i == self.my_index: 
                 continue
 
             p_data = game_data.get(i)
-            # If player was not active in the last game, their strength score defaults to 0.0
             if p_data is None or not p_data.get("hole_cards"):
-                opponent_strengths[i] = 0.0
                 continue
 
-            # --- 1. Calculate Looseness (L_i) ---
-            l_data = self.looseness_tracker.get(i)
-            games_seen = l_data.get("games_seen", 0) if l_data else 0
-            
-            if games_seen > 0:
-                looseness = l_data["games_played"] / games_seen
-                L_i = max(0.05, min(looseness, 0.5)) 
-            else:
-                L_i = 0.2 # Default looseness
-            
-            # --- 2. Calculate Aggression (V-Factor) ---
+            active[i] = True
             r_bets = p_data.get("Round Bets", {})
-            r3_win_prob = p_data.get("Win Probabilities", [0, 0, 0])[-1] 
-            is_folded = p_data.get("folded", True)
+            total_bets[i] = r_bets.get(1, 0) + r_bets.get(2, 0) + r_bets.get(3, 0)
+            r3_win_prob[i] = p_data.get("Win Probabilities", [0, 0, 0])[-1]
+            is_folded[i] = p_data.get("folded", True)
+            final_score[i] = p_data.get("Final Hand Score", self.MAX_SCORE_TREYS)
 
-            V_factor = 0.0
-            if not is_folded:
-                total_bets = r_bets.get(1, 0) + r_bets.get(2, 0) + r_bets.get(3, 0)
-                
-                if r3_win_prob > 0.01:
-                    V_factor = total_bets / (r3_win_prob * self.STARTING_STACK) 
-                elif total_bets > 0:
-                    # Heuristic for near-zero equity (aggressive, unstable score)
-                    V_factor = total_bets / (0.01 * self.STARTING_STACK) 
-                
-            # --- 3. Calculate Hand Weakness Bonus (H_it) ---
-            H_it = 1.0
-            final_score = p_data.get("Final Hand Score", self.MAX_SCORE_TREYS)
-            # Apply bonus if they reached showdown with a weak hand (Weakness > 0.5)
-            if final_score < self.MAX_SCORE_TREYS:
-                weakness = min(final_score / self.MAX_SCORE_TREYS, 1.0)
-                if weakness > 0.5:
-                    # Simple Bonus: Add the weakness factor directly (1.5x max)
-                    H_it = 1.0 + weakness 
-            
-            # --- 4. Final Aggregation (S_Final) ---
-            # S_Final = V_Factor * H_it * L_i (Looseness acts as a weight/damper)
-            # Using Looseness (L_i) as a simple multiplier for the final score, 
-            # implying that aggression from tight players is weighted higher.
-            # We use an inverse L_i to reward tight players' aggression: (1 / L_i)
-            
-            # Simple Scaler: Rewards aggression from tighter players
-            L_scaler = min(3.0, 1.0 / L_i) if L_i > 0 else 1.0
+        # --- 1. Calculate Looseness (L_i) ---
+        # Default looseness is 0.2 for players never seen yet.
+        looseness = self.games_played / np.maximum(self.games_seen, 1)
+        L_i = np.where(self.games_seen > 0, np.clip(looseness, 0.05, 0.5), 0.2)
 
-            S_final = V_factor * H_it * L_scaler
+        # --- 2. Calculate Aggression (V-Factor) ---
+        # Near-zero equity is floored at 1% (aggressive, unstable score); folded players score 0.
+        V_factor = total_bets / (np.maximum(r3_win_prob, 0.01) * self.STARTING_STACK)
+        V_factor[is_folded] = 0.0
 
-            # Normalize to [0, 1]
-            opponent_strengths[i] = min(S_final / self.MAX_EXPECTED_STRENGTH, 1.0)
-            
-        return opponent_strengths
+        # --- 3. Calculate Hand Weakness Bonus (H_it) ---
+        # Apply bonus if they reached showdown with a weak hand (Weakness > 0.5):
+        # Simple Bonus: Add the weakness factor directly (1.5x max)
+        weakness = np.minimum(final_score / self.MAX_SCORE_TREYS, 1.0)
+        H_it = np.where((final_score < self.MAX_SCORE_TREYS) & (weakness > 0.5), 1.0 + weakness, 1.0)
+
+        # --- 4. Final Aggregation (S_Final) ---
+        # S_Final = V_Factor * H_it * L_i (Looseness acts as a weight/damper)
+        # We use an inverse L_i to reward tight players' aggression: (1 / L_i)
+        # Simple Scaler: Rewards aggression from tighter players (L_i is always >= 0.05)
+        L_scaler = np.minimum(3.0, 1.0 / L_i)
+
+        S_final = V_factor * H_it * L_scaler
+
+        # Normalize to [0, 1]
+        opponent_strengths = np.where(active, np.minimum(S_final / self.MAX_EXPECTED_STRENGTH, 1.0), 0.0)
+        return opponent_strengths.tolist()
 
 
     # --- Betting Round Implementations (Placeholder Logic) ---
@@ -146,7 +134,8 @@ class Fujin:
         R1 logic: Folds based on a threshold influenced by average opponent strength.
         """
         active_opp_strengths = [s for i, s in enumerate(self.opponent_strengths) if i != self.my_index]
-        avg_opp_strength = np.mean(active_opp_strengths) if active_opp_strengths else 0.5
+        # Plain sum/len: a NumPy mean over 4 floats costs more than the arithmetic itself.
+        avg_opp_strength = (sum(active_opp_strengths) / len(active_opp_strengths)) if active_opp_strengths else 0.5
         
         fold_threshold = 0.10 + (0.10 * avg_opp_strength)
         
@@ -161,9 +150,17 @@ class Fujin:
 
     def round2(self, hole, comm, r1_bets, stacks, pot, win_prob):
         
-        base_bet = r1_bets[self.my_index]
+        my_index = self.my_index
+        base_bet = r1_bets[my_index]
         
-        is_opp_aggressive = any(b > base_bet for i, b in r1_bets.items() if i != self.my_index and i < self.NUM_PLAYERS)
+        # An opponent is aggressive if they out-bet Fujin in R1; stop at the first one found.
+        # Indexing by position works whether r1_bets is a dict, a list or an array.
+        is_opp_aggressive = False
+        for i in range(len(r1_bets)):
+            b = r1_bets[i]
+            if b > base_bet and i != my_index and i < self.NUM_PLAYERS:
+                is_opp_aggressive = True
+                break
         
         multiplier = 0.5 + win_prob
         